@@ -100,8 +100,13 @@ const char *dcm_frame_get_photometric_interpretation(const DcmFrame *frame);
 const char *dcm_frame_get_transfer_syntax_uid(const DcmFrame *frame);
 const char *dcm_frame_get_value(const DcmFrame *frame);
 
+void *memcpy(void *dest, const void *src, size_t n);
+
 ''')
 
+# the C library, for memcpy() with the GIL released
+c_lib = ffi.dlopen(None)
+
 print(f"init for libdicom ...")
 dicom_lib.dcm_init()
 
@@ -159,3 +164,5 @@ from .dataset import *
 from .sequence import *
 from .filehandle import *
 from .frame import *
+from .query import *
+from .header import *
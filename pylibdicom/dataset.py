@@ -1,7 +1,20 @@
+import collections.abc
 import pylibdicom
 from pylibdicom import ffi, dicom_lib, _to_string, _to_bytes
+from pylibdicom.tag import _tag_value
+
+class DataSet(collections.abc.Mapping):
+    """A read-only mapping from Tag to Element.
+
+    Keys can be Tags, int tags or keywords. The tag list and Element
+    wrappers are made on first access and cached, so repeat traversals of a
+    dataset don't go back to libdicom.
+
+    Unlike most mappings, DataSets compare and hash by identity, since
+    comparing contents would mean making every Element.
+
+    """
 
-class DataSet:
     def __init__(self, pointer, steal=False):
         # record the pointer we were given to manage
         # if steal is set, destroy on GC
@@ -10,40 +23,84 @@ class DataSet:
         else:
             self.pointer = pointer
 
-        return 
+        # tag list, and int tag -> Element, filled in on demand
+        self._tags = None
+        self._elements = {}
+
+        return
 
     def __repr__(self):
         return f"<DataSet of {self.count()} items>"
 
     def count(self):
+        if self._tags is not None:
+            return len(self._tags)
+
         return dicom_lib.dcm_dataset_count(self.pointer)
 
     def tags(self):
-        n = self.count()
-        int_tags = ffi.new(f"uint32_t[{n}]")
-        dicom_lib.dcm_dataset_copy_tags(self.pointer, int_tags, n)
+        if self._tags is None:
+            n = dicom_lib.dcm_dataset_count(self.pointer)
+            int_tags = ffi.new(f"uint32_t[{n}]")
+            dicom_lib.dcm_dataset_copy_tags(self.pointer, int_tags, n)
+            self._tags = [pylibdicom.Tag(tag) for tag in int_tags]
 
-        return [pylibdicom.Tag(tag) for tag in int_tags]
+        return list(self._tags)
 
-    def _contains(self, tag):
-        if isinstance(tag, pylibdicom.Tag):
-            tag = tag.value
+    def __eq__(self, other):
+        return self is other
 
-        return dicom_lib.dcm_dataset_contains(self.pointer, tag)
+    __hash__ = object.__hash__
 
     def contains(self, tag):
-        pointer = self._contains(tag)
-        return pointer != ffi.NULL
+        value = _tag_value(tag)
+        if value is None:
+            return False
+
+        return value in self._elements or \
+            dicom_lib.dcm_dataset_contains(self.pointer, value) != ffi.NULL
+
+    def _element(self, tag):
+        # the cached Element for a tag, or None if the tag (or keyword) is
+        # missing
+        value = _tag_value(tag)
+        if value is None:
+            return None
+        element = self._elements.get(value)
+        if element is None:
+            pointer = dicom_lib.dcm_dataset_contains(self.pointer, value)
+            if pointer == ffi.NULL:
+                return None
+            element = pylibdicom.Element(pointer)
+            self._elements[value] = element
+
+        return element
+
+    def __getitem__(self, tag):
+        element = self._element(tag)
+        if element is None:
+            raise KeyError(tag)
 
-    def get(self, tag):
-        pointer = self._contains(tag)
-        if pointer == ffi.NULL:
-            raise Exception(f"dataset does not contain tag {tag}")
+        return element
 
-        return pylibdicom.Element(pointer)
+    def __contains__(self, tag):
+        return self.contains(tag)
 
+    def __iter__(self):
+        return iter(self.tags())
 
+    def __len__(self):
+        return self.count()
 
+    def get(self, tag, default=None):
+        element = self._element(tag)
+        if element is None:
+            return default
 
+        return element
 
+    def select(self, path):
+        if not isinstance(path, pylibdicom.Query):
+            path = pylibdicom.Query(path)
 
+        return path.select(self)
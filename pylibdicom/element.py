@@ -10,6 +10,15 @@ class Element:
         else:
             self.pointer = pointer
 
+        # decoded attributes, filled in on first access
+        self._tag = None
+        self._vr = None
+        self._vr_class = None
+        self._vm = None
+        self._length = None
+        self._sequence = None
+        self._string = None
+
         return 
 
     def __repr__(self):
@@ -20,19 +29,30 @@ class Element:
                f"{self.value_to_string()}"
 
     def tag(self):
-        return pylibdicom.Tag(dicom_lib.dcm_element_get_tag(self.pointer))
+        if self._tag is None:
+            value = dicom_lib.dcm_element_get_tag(self.pointer)
+            self._tag = pylibdicom.Tag(value)
+        return self._tag
 
     def vr(self):
-        return pylibdicom.VR(dicom_lib.dcm_element_get_vr(self.pointer))
+        if self._vr is None:
+            self._vr = pylibdicom.VR(dicom_lib.dcm_element_get_vr(self.pointer))
+        return self._vr
 
     def vr_class(self):
-        return dicom_lib.dcm_dict_vr_class(self.vr().value)
+        if self._vr_class is None:
+            self._vr_class = dicom_lib.dcm_dict_vr_class(self.vr().value)
+        return self._vr_class
 
     def vm(self):
-        return dicom_lib.dcm_element_get_vm(self.pointer)
+        if self._vm is None:
+            self._vm = dicom_lib.dcm_element_get_vm(self.pointer)
+        return self._vm
 
     def length(self):
-        return dicom_lib.dcm_element_get_length(self.pointer)
+        if self._length is None:
+            self._length = dicom_lib.dcm_element_get_length(self.pointer)
+        return self._length
 
     def get_value_integer(self, index):
         error = pylibdicom.Error()
@@ -89,7 +109,10 @@ class Element:
         return mem
 
     def get_value_sequence(self):
-        length = self.length()
+        # the Sequence is cached, so its items keep their caches too
+        if self._sequence is not None:
+            return self._sequence
+
         error = pylibdicom.Error()
         seqp = ffi.new("DcmSequence*[1]")
         success = dicom_lib.dcm_element_get_value_sequence(error.pointer,
@@ -98,7 +121,9 @@ class Element:
         if not success:
             raise error.exception()
 
-        return pylibdicom.Sequence(seqp[0])
+        self._sequence = pylibdicom.Sequence(seqp[0])
+
+        return self._sequence
 
     def get_value(self):
         klass = self.vr_class()
@@ -117,9 +142,11 @@ class Element:
             raise Exception("unimplemented VR class")
 
     def value_to_string(self):
-        pointer = dicom_lib.dcm_element_value_to_string(self.pointer);
-        if pointer == ffi.NULL:
-            raise Exception(f"Element value cannot be printed")
-        pointer = ffi.gc(pointer, dicom_lib.dcm_free)
-        return _to_string(pointer)
+        if self._string is None:
+            pointer = dicom_lib.dcm_element_value_to_string(self.pointer);
+            if pointer == ffi.NULL:
+                raise Exception(f"Element value cannot be printed")
+            pointer = ffi.gc(pointer, dicom_lib.dcm_free)
+            self._string = _to_string(pointer)
+        return self._string
 
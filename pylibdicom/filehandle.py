@@ -1,5 +1,75 @@
+import hashlib
+import math
+import threading
 import pylibdicom
-from pylibdicom import ffi, dicom_lib, _to_string, _to_bytes
+from pylibdicom import ffi, dicom_lib, c_lib, _to_string, _to_bytes
+from pylibdicom.pool import _map_bounded
+
+# for output buffers we fill completely, so there's no need to zero them
+_new_uncleared = ffi.new_allocator(should_clear_after_alloc=False)
+
+# transfer syntaxes where frame values are the pixels themselves
+_UNCOMPRESSED = {
+    "1.2.840.10008.1.2",
+    "1.2.840.10008.1.2.1",
+    "1.2.840.10008.1.2.2",
+}
+
+
+def _frame_pixels(pointer):
+    # a numpy view of an uncompressed frame, or None
+    import numpy as np
+
+    uid = _to_string(dicom_lib.dcm_frame_get_transfer_syntax_uid(pointer))
+    bits_allocated = dicom_lib.dcm_frame_get_bits_allocated(pointer)
+    if uid not in _UNCOMPRESSED or bits_allocated not in (8, 16, 32):
+        return None
+
+    signed = dicom_lib.dcm_frame_get_pixel_representation(pointer) == 1
+    dtype = np.dtype(f"{'i' if signed else 'u'}{bits_allocated // 8}")
+    if uid == "1.2.840.10008.1.2.2":
+        dtype = dtype.newbyteorder(">")
+    length = dicom_lib.dcm_frame_get_length(pointer)
+    value = ffi.buffer(dicom_lib.dcm_frame_get_value(pointer), length)
+    pixels = np.frombuffer(value, dtype=dtype)
+
+    rows = dicom_lib.dcm_frame_get_rows(pointer)
+    columns = dicom_lib.dcm_frame_get_columns(pointer)
+    bands = dicom_lib.dcm_frame_get_samples_per_pixel(pointer)
+    n = rows * columns * bands
+    if len(pixels) < n:
+        return None
+    pixels = pixels[:n]
+
+    # pixels as (pixel, band)
+    if dicom_lib.dcm_frame_get_planar_configuration(pointer) == 1:
+        return pixels.reshape(bands, rows * columns).T
+    else:
+        return pixels.reshape(rows * columns, bands)
+
+
+def _white_fraction(pointer, pixels, white_threshold):
+    # fraction of near-white pixels, or NaN if we can't tell what white is
+    photometric_interpretation = \
+        _to_string(dicom_lib.dcm_frame_get_photometric_interpretation(pointer))
+    bits_stored = dicom_lib.dcm_frame_get_bits_stored(pointer)
+    if dicom_lib.dcm_frame_get_pixel_representation(pointer) == 1:
+        low = -(1 << (bits_stored - 1))
+        high = (1 << (bits_stored - 1)) - 1
+    else:
+        low = 0
+        high = (1 << bits_stored) - 1
+
+    if photometric_interpretation in ("MONOCHROME2", "RGB"):
+        # white is high, and every sample must be near it
+        white = low + white_threshold * (high - low)
+        return (pixels.min(axis=1) >= white).mean()
+    elif photometric_interpretation == "MONOCHROME1":
+        # white is low
+        white = high - white_threshold * (high - low)
+        return (pixels.max(axis=1) <= white).mean()
+    else:
+        return math.nan
 
 class Filehandle:
     def __init__(self, pointer):
@@ -69,4 +139,128 @@ class Filehandle:
         # pointer will need freeing, so Frame must steal it (take ownership)
         return pylibdicom.Frame(pointer, True)
 
+    def read_frames_raw(self, frame_numbers):
+        """Read a batch of frames into a single buffer.
+
+        Returns (buffer, offsets), where frame i is
+        buffer[offsets[i]:offsets[i + 1]]. No Frame objects are made and
+        each frame is copied out and freed as soon as it is read.
+
+        """
+        frame_numbers = list(frame_numbers)
+        error = pylibdicom.Error()
+        mem = _new_uncleared("char[0]")
+        capacity = 0
+        offsets = [0]
+        for frame_number in frame_numbers:
+            pointer = dicom_lib.dcm_filehandle_read_frame(error.pointer,
+                                                          self.pointer,
+                                                          frame_number)
+            if pointer == ffi.NULL:
+                raise error.exception()
+
+            try:
+                length = dicom_lib.dcm_frame_get_length(pointer)
+                start = offsets[-1]
+                end = start + length
+                if end > capacity:
+                    # grow from what we've used, since compressed frames
+                    # can vary a lot in size
+                    capacity = max(end, 2 * capacity)
+                    new_mem = _new_uncleared(f"char[{capacity}]")
+                    c_lib.memcpy(new_mem, mem, start)
+                    mem = new_mem
+                c_lib.memcpy(mem + start,
+                             dicom_lib.dcm_frame_get_value(pointer),
+                             length)
+                offsets.append(end)
+            finally:
+                dicom_lib.dcm_frame_destroy(pointer)
+
+        # copy down to size, so we don't keep the spare capacity alive
+        if capacity > offsets[-1]:
+            new_mem = _new_uncleared(f"char[{offsets[-1]}]")
+            c_lib.memcpy(new_mem, mem, offsets[-1])
+            mem = new_mem
+
+        return ffi.buffer(mem), offsets
+
+    def frame_statistics(self, frame_numbers=None, hash_name="sha1",
+                         white_threshold=0.9, max_workers=None):
+        """Hash and summarise many frames with a pool of threads.
+
+        Frames default to every frame in the file. Each frame is read,
+        hashed (with any hashlib algorithm) and summarised, then freed
+        immediately, so only a few frames are alive at once.
+
+        Returns a dict of numpy arrays with one entry per frame:
+
+            "hash": the frame value digest, as rows of a uint8 array
+            "mean", "variance": of all pixel samples
+            "white_fraction": fraction of pixels with every sample at
+                least white_threshold of the way from black to white
+
+        Statistics need decoded pixels, so for frames in a compressed
+        transfer syntax they are NaN and only the hash is computed.
+        white_fraction is also NaN unless the photometric interpretation
+        is MONOCHROME1, MONOCHROME2 or RGB.
+
+        """
+        import numpy as np
+
+        if frame_numbers is None:
+            metadata = self.get_metadata()
+            # single-frame images often have no NumberOfFrames
+            element = metadata.get("NumberOfFrames")
+            num_frames = 1
+            if element is not None:
+                num_frames = int(element.get_value()[0])
+            frame_numbers = range(1, num_frames + 1)
+        frame_numbers = list(frame_numbers)
+
+        n = len(frame_numbers)
+        digest_size = hashlib.new(hash_name).digest_size
+        hashes = np.zeros((n, digest_size), dtype=np.uint8)
+        mean = np.full(n, np.nan)
+        variance = np.full(n, np.nan)
+        white_fraction = np.full(n, np.nan)
+
+        # libdicom filehandles are not thread-safe, so reads are serialised,
+        # but hashing and statistics run in parallel with the GIL released
+        lock = threading.Lock()
+
+        def scan(i):
+            error = pylibdicom.Error()
+            with lock:
+                pointer = dicom_lib.dcm_filehandle_read_frame(error.pointer,
+                                                              self.pointer,
+                                                              frame_numbers[i])
+            if pointer == ffi.NULL:
+                raise error.exception()
+
+            try:
+                length = dicom_lib.dcm_frame_get_length(pointer)
+                value = ffi.buffer(dicom_lib.dcm_frame_get_value(pointer),
+                                   length)
+                digest = hashlib.new(hash_name, value).digest()
+                hashes[i] = np.frombuffer(digest, dtype=np.uint8)
+
+                pixels = _frame_pixels(pointer)
+                if pixels is not None and pixels.size > 0:
+                    mean[i] = pixels.mean(dtype=np.float64)
+                    variance[i] = pixels.var(dtype=np.float64)
+                    white_fraction[i] = \
+                        _white_fraction(pointer, pixels, white_threshold)
+            finally:
+                dicom_lib.dcm_frame_destroy(pointer)
+
+        # run to the end, raising any exception from the workers
+        for _ in _map_bounded(scan, range(0, n), max_workers):
+            pass
 
+        return {
+            "hash": hashes,
+            "mean": mean,
+            "variance": variance,
+            "white_fraction": white_fraction,
+        }
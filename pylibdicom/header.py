@@ -0,0 +1,102 @@
+import functools
+import pylibdicom
+from pylibdicom import ffi, dicom_lib, _to_string, _to_bytes
+from pylibdicom.tag import _tag_value
+from pylibdicom.pool import _map_bounded
+
+"""
+usage:
+        header = pylibdicom.read_header("sm_image.dcm",
+                                        tags=["SOPInstanceUID", "Modality"])
+        print(header["SOPInstanceUID"])
+
+        for path, header in zip(paths, pylibdicom.read_headers(paths)):
+            print(path, header)
+"""
+
+# every tag after the File Meta Information is at least this
+_FIRST_DATASET_TAG = 0x00030000
+
+
+def _known_tag_value(tag):
+    value = _tag_value(tag)
+    if value is None:
+        raise Exception(f"Unknown tag '{tag}'")
+
+    return value
+
+
+def _key(tag):
+    keyword = tag.keyword()
+    if keyword == "NULL":
+        return repr(tag)
+
+    return keyword
+
+
+def _decode(dataset, wanted, header):
+    # add decoded values for wanted tags (or all tags, if wanted is None) to
+    # header ... sequences and binary values are left out of the result
+    if wanted is None:
+        int_tags = [tag.value for tag in dataset.tags()]
+    else:
+        int_tags = wanted
+
+    for tag in int_tags:
+        element = dataset.get(tag)
+        if element is None:
+            continue
+        klass = element.vr_class()
+        if klass == pylibdicom.VRClass.SEQUENCE or \
+            klass == pylibdicom.VRClass.BINARY:
+            continue
+        header[tag] = element.get_value()
+
+
+def read_header(filename, tags=None):
+    """Read a set of top-level tags from a file.
+
+    tags is a list of Tags, int tags or keywords, or None for every
+    top-level tag.
+
+    If every tag asked for is in the File Meta Information (group 0002),
+    only the File Meta Information is parsed, which is fast. For any other
+    tag this is no faster than Filehandle.get_metadata(): the whole libdicom
+    metadata subset is parsed and tags only filters the result. libdicom
+    has no way to stop that parse early.
+
+    Returns a dict of keyword to value, as Element.get_value() would give.
+    Sequences and binary values are parsed, but left out of the result.
+
+    """
+    wanted = None if tags is None else [_known_tag_value(tag) for tag in tags]
+
+    file = pylibdicom.Filehandle.create_from_file(filename)
+    header = {}
+    _decode(file.get_file_meta(), wanted, header)
+
+    if wanted is None or any(tag >= _FIRST_DATASET_TAG for tag in wanted):
+        _decode(file.get_metadata(), wanted, header)
+
+    return {_key(pylibdicom.Tag(tag)): value for tag, value in header.items()}
+
+
+def _read_header_or_error(filename, tags):
+    try:
+        return read_header(filename, tags)
+    except Exception as e:
+        return e
+
+
+def read_headers(filenames, tags=None, max_workers=None):
+    """Read headers from many files with a pool of threads.
+
+    libdicom runs with the GIL released, so file opens and parsing overlap,
+    but each file costs the same parse as read_header().
+    Results are generated in the same order as filenames. A file which
+    can't be read gives its exception in place of a dict, so one bad file
+    does not stop a batch.
+
+    """
+    read = functools.partial(_read_header_or_error, tags=tags)
+    yield from _map_bounded(read, filenames, max_workers)
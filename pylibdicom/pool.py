@@ -0,0 +1,26 @@
+import collections
+import concurrent.futures
+import os
+
+
+def _map_bounded(function, iterable, max_workers=None):
+    """Run function over iterable with a pool of threads.
+
+    Results are generated in order. Only a few items per thread are in
+    flight at once, so very long iterables don't turn into very long lists
+    of futures.
+
+    """
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+    window = 4 * max_workers
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        pending = collections.deque()
+        for item in iterable:
+            pending.append(executor.submit(function, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
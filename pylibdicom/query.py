@@ -0,0 +1,119 @@
+import functools
+import re
+import pylibdicom
+from pylibdicom import ffi, dicom_lib, _to_string, _to_bytes
+
+"""
+usage:
+        query = pylibdicom.Query("SharedFunctionalGroupsSequence/*/"
+                                 "PixelMeasuresSequence/*/PixelSpacing")
+        for element in query.select(metadata):
+            print(element.get_value())
+
+A path is a list of steps separated by "/". Tag steps are a keyword, eg.
+"PixelSpacing", or a tag in "(gggg,eeee)" hex form. Every step after a
+sequence tag selects items in that sequence, either "*" for all items or an
+integer index. A single "**" step matches any number of levels of nested
+sequences, so "ReferencedSeriesSequence/*/**/ReferencedSOPInstanceUID" finds
+every ReferencedSOPInstanceUID anywhere under ReferencedSeriesSequence. Only
+one "**" is allowed, so each element is found at most once.
+"""
+
+_TAG = 0
+_ITEM = 1
+_DEEP = 2
+
+_hex_tag = re.compile(r"^\(([0-9a-fA-F]{4}),([0-9a-fA-F]{4})\)$")
+
+
+def _parse_tag(text):
+    match = _hex_tag.match(text)
+    if match:
+        return (int(match.group(1), 16) << 16) | int(match.group(2), 16)
+
+    return pylibdicom.Tag.create_from_keyword(text).value
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(path):
+    # turn a path string into a tuple of (kind, arg) steps, with all tags
+    # resolved to integers
+    steps = []
+    for text in path.split("/"):
+        previous = steps[-1][0] if steps else None
+        if text == "**":
+            if previous == _TAG or previous == _DEEP:
+                raise Exception(f"bad path '{path}': '**' must follow an item")
+            # more than one "**" could reach an element by several routes
+            if any(kind == _DEEP for kind, arg in steps):
+                raise Exception(f"bad path '{path}': only one '**' allowed")
+            steps.append((_DEEP, None))
+        elif previous == _TAG:
+            if text == "*":
+                steps.append((_ITEM, None))
+            elif text.isdigit():
+                steps.append((_ITEM, int(text)))
+            else:
+                raise Exception(f"bad path '{path}': "
+                                f"expected item index after sequence, "
+                                f"got '{text}'")
+        else:
+            steps.append((_TAG, _parse_tag(text)))
+
+    if not steps or steps[-1][0] != _TAG:
+        raise Exception(f"bad path '{path}': must end with a tag")
+
+    return tuple(steps)
+
+
+def _items(sequence, index):
+    if index is None:
+        yield from sequence
+    elif index < len(sequence):
+        yield sequence[index]
+
+
+def _walk(dataset, steps, i):
+    # walk the cached DataSet/Sequence/Element wrappers, so a query costs
+    # almost nothing on a header that has already been traversed
+    kind, arg = steps[i]
+
+    if kind == _DEEP:
+        # zero levels, then every item of every nested sequence
+        yield from _walk(dataset, steps, i + 1)
+        for element in dataset.values():
+            if element.vr_class() == pylibdicom.VRClass.SEQUENCE:
+                for item in element.get_value_sequence():
+                    yield from _walk(item, steps, i)
+        return
+
+    element = dataset._element(arg)
+    if element is None:
+        return
+
+    if i == len(steps) - 1:
+        yield element
+    elif element.vr_class() == pylibdicom.VRClass.SEQUENCE:
+        for item in _items(element.get_value_sequence(), steps[i + 1][1]):
+            yield from _walk(item, steps, i + 2)
+
+
+class Query:
+    """A path through a dataset, compiled once to a list of integer tags.
+
+    Matching only visits the sequences and items named by the path (plus
+    all nested sequences below a "**" step), and elements are generated
+    lazily. Lookups go through the DataSet and Element caches, so repeat
+    queries on the same header are cheap.
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.steps = _compile(path)
+
+    def __repr__(self):
+        return f"<Query '{self.path}'>"
+
+    def select(self, dataset):
+        return _walk(dataset, self.steps, 0)
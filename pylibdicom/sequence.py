@@ -1,7 +1,18 @@
+import collections.abc
 import pylibdicom
 from pylibdicom import ffi, dicom_lib, _to_string, _to_bytes
 
-class Sequence:
+class Sequence(collections.abc.Sequence):
+    """A read-only sequence of DataSet items.
+
+    Item DataSets are made on first access and cached, so they keep their
+    own cached Elements between traversals.
+
+    count() with no argument gives the number of items, as it always has.
+    count(value) is the usual collections.abc.Sequence method.
+
+    """
+
     def __init__(self, pointer, steal=False):
         # record the pointer we were given to manage
         # if steal is set, destroy on GC
@@ -10,24 +21,53 @@ class Sequence:
         else:
             self.pointer = pointer
 
-        return 
+        # a slot per item, filled in on demand
+        self._items = None
+
+        return
 
     def __repr__(self):
         return f"<Sequence of {self.count()} items>"
 
-    def count(self):
-        return dicom_lib.dcm_sequence_count(self.pointer)
+    def count(self, *value):
+        if value:
+            return super().count(*value)
 
-    def get(self, index):
-        error = pylibdicom.Error()
-        pointer = dicom_lib.dcm_sequence_get(error.pointer, self.pointer, index)
-        if pointer == ffi.NULL:
-            raise error.exception()
+        if self._items is None:
+            n = dicom_lib.dcm_sequence_count(self.pointer)
+            self._items = [None] * n
 
-        return pylibdicom.DataSet(pointer)
+        return len(self._items)
+
+    def get(self, index):
+        count = self.count()
+        if index < 0 or index >= count:
+            raise IndexError(f"sequence index {index} out of range")
 
+        dataset = self._items[index]
+        if dataset is None:
+            error = pylibdicom.Error()
+            pointer = dicom_lib.dcm_sequence_get(error.pointer,
+                                                 self.pointer,
+                                                 index)
+            if pointer == ffi.NULL:
+                raise error.exception()
+            dataset = pylibdicom.DataSet(pointer)
+            self._items[index] = dataset
 
+        return dataset
 
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.get(i) for i in range(*index.indices(self.count()))]
+        if index < 0:
+            index += self.count()
 
+        return self.get(index)
 
+    def __iter__(self):
+        for index in range(0, self.count()):
+            yield self.get(index)
 
+    def __len__(self):
+        return self.count()
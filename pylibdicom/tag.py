@@ -1,19 +1,42 @@
 import pylibdicom
 from pylibdicom import ffi, dicom_lib, _to_string, _to_bytes
 
+
+def _tag_value(tag):
+    """Get the int value of a Tag, int tag or keyword.
+
+    Returns None for an unknown keyword.
+
+    """
+    if isinstance(tag, Tag):
+        return tag.value
+    elif isinstance(tag, str):
+        value = dicom_lib.dcm_dict_tag_from_keyword(_to_bytes(tag))
+        if value == 0xffffffff:
+            return None
+        return value
+
+    return tag
+
+
 class Tag:
     def __init__(self, value):
         self.value = value
+        # filled in on first access
+        self._keyword = None
 
     @staticmethod
     def create_from_keyword(keyword):
-        value = dicom_lib.dcm_dict_tag_from_keyword(_to_bytes(keyword))
-        if value == 0xffffffff:
+        value = _tag_value(keyword)
+        if value is None:
             raise Exception(f"Unknown tag '{keyword}'")
         return Tag(value)
 
     def keyword(self):
-        return _to_string(dicom_lib.dcm_dict_keyword_from_tag(self.value))
+        if self._keyword is None:
+            cstr = dicom_lib.dcm_dict_keyword_from_tag(self.value)
+            self._keyword = _to_string(cstr)
+        return self._keyword
 
     def group(self):
         return self.value >> 16
@@ -21,6 +44,14 @@ class Tag:
     def number(self):
         return self.value & 0xffff
 
+    def __eq__(self, other):
+        if not isinstance(other, Tag):
+            return NotImplemented
+        return self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
     def __repr__(self):
         return f"({self.group():04x},{self.number():04x})"
 
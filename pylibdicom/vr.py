@@ -4,6 +4,8 @@ from pylibdicom import ffi, dicom_lib, _to_string, _to_bytes
 class VR:
     def __init__(self, value):
         self.value = value
+        # filled in on first access
+        self._name = None
 
     @staticmethod
     def create_from_name(name):
@@ -13,7 +15,9 @@ class VR:
         return VR(value)
 
     def name(self):
-        return _to_string(dicom_lib.dcm_dict_str_from_vr(self.value))
+        if self._name is None:
+            self._name = _to_string(dicom_lib.dcm_dict_str_from_vr(self.value))
+        return self._name
 
     def __repr__(self):
         return self.name()
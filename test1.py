@@ -72,3 +72,45 @@ for frame_number in range(1, num_frames + 1):
     value = frame.get_value()
     print(f"frame {frame_number} -> {frame} {len(value)} bytes")
 
+
+print(f"testing select ...")
+path = "SharedFunctionalGroupsSequence/*/PixelMeasuresSequence/*/PixelSpacing"
+for element in metadata.select(path):
+    print(f"{path} = {element.get_value()}")
+for element in metadata.select("**/UniversalEntityID"):
+    print(f"**/UniversalEntityID = {element.get_value()}")
+
+print(f"testing DataSet and Sequence as containers ...")
+print(f"len(metadata) = {len(metadata)}")
+print(f"'NumberOfFrames' in metadata = {'NumberOfFrames' in metadata}")
+print(f"metadata.get('PixelData') = {metadata.get('PixelData')}")
+seq = metadata["SharedFunctionalGroupsSequence"].get_value()
+for index, item in enumerate(seq):
+    print(f"item {index} = {item}")
+    for tag, element in item.items():
+        print(f"  {tag} = {element}")
+
+print(f"testing read_frames_raw ...")
+buffer, offsets = file.read_frames_raw(range(1, num_frames + 1))
+print(f"{num_frames} frames -> {len(buffer)} bytes, offsets = {offsets}")
+
+print(f"testing read_header ...")
+header = pylibdicom.read_header("sm_image.dcm",
+                                tags=["SOPInstanceUID", "NumberOfFrames"])
+print(f"header = {header}")
+header = pylibdicom.read_header("sm_image.dcm",
+                                tags=["TransferSyntaxUID"])
+print(f"file meta only = {header}")
+for header in pylibdicom.read_headers(["sm_image.dcm", "banana.dcm"],
+                                      tags=["Modality"]):
+    print(f"read_headers -> {header}")
+
+print(f"testing frame_statistics ...")
+try:
+    import numpy
+except ImportError:
+    print(f"numpy not installed, skipping")
+else:
+    stats = file.frame_statistics()
+    for key, value in stats.items():
+        print(f"{key} = {value[:3]} ...")